@@ -3,6 +3,8 @@ from src.plugins.plugin_registry import load_plugins, get_plugin_instance
 from src.utils.image_utils import resize_image, change_orientation
 from unittest.mock import patch, MagicMock
 from PIL import Image
+import numpy as np
+import requests
 
 PLUGIN_CONFIG_FILE = "install/config_base/plugins.json"
 RESOLUTIONS = [
@@ -35,10 +37,27 @@ load_plugins(plugin_config)
 plugin_config = plugin_config[0]
 plugin_instance = get_plugin_instance(plugin_config)
 
+# Every resolution/orientation renders the same data, so only fetch each URL once.
+# Requests made via requests.get and shared sessions both go through Session.request.
+_session_request = requests.Session.request
+_response_cache = {}
+
+def cached_request(self, method, url, *args, **kwargs):
+    if method.upper() != "GET":
+        return _session_request(self, method, url, *args, **kwargs)
+    key = (url, repr(kwargs.get("params")))
+    if key not in _response_cache:
+        response = _session_request(self, method, url, *args, **kwargs)
+        response.content  # read the body so the response can be consumed repeatedly
+        _response_cache[key] = response
+    return _response_cache[key]
+
+# each row holds the horizontal render followed by the vertical render rotated back
+column_width = max([max(resolution) for resolution in RESOLUTIONS])
 total_height = sum([max(resolution) for resolution in RESOLUTIONS])
-total_width = max([max(resolution) for resolution in RESOLUTIONS]) * 2
+total_width = column_width + max([min(resolution) for resolution in RESOLUTIONS])
 
-composite = Image.new('RGB', (total_width, total_height), color='gray')
+composite = np.full((total_height, total_width, 3), 128, dtype=np.uint8)
 y = 0
 for resolution in RESOLUTIONS:
     x = 0
@@ -47,7 +66,8 @@ for resolution in RESOLUTIONS:
         mock_device_config.get_resolution.return_value = resolution
         mock_device_config.get_config.return_value = orientation
 
-        img = plugin_instance.generate_image(plugin_settings, mock_device_config)
+        with patch.object(requests.Session, "request", cached_request):
+            img = plugin_instance.generate_image(plugin_settings, mock_device_config)
 
         # post processing thats applied before being displayed
         img = change_orientation(img, orientation)
@@ -55,9 +75,10 @@ for resolution in RESOLUTIONS:
         # rotate the image again when pasting
         if orientation == "vertical":
             img = img.rotate(-90, expand=1)
-        composite.paste(img, (x, y))
-        x= int(total_width/2)
+        img_width, img_height = img.size
+        composite[y:y+img_height, x:x+img_width] = np.asarray(img.convert('RGB'))
+        x = column_width
     y+= max(width, height)
 
-composite.show()
+Image.fromarray(composite).show()
 
@@ -1,43 +1,87 @@
-from flask import Blueprint, request, jsonify, current_app, render_template
+from flask import Blueprint, request, jsonify, render_template, make_response
 from dotenv import dotenv_values
 import os
-import re
+import io
+import shutil
+import time
 import logging
 
 logger = logging.getLogger(__name__)
 apikeys_bp = Blueprint("apikeys", __name__)
 
-# Path to .env file
+# Fixed-length mask so the displayed value doesn't reveal the key length
+MASKED_VALUE = "●" * 8
+
+# Included in the page ETag so cached pages are invalidated when the app restarts (e.g. after an update)
+_STARTUP_ID = f"{time.time_ns():x}"
+
+# Parsed .env entries keyed by path, stored with the (mtime, size) they were parsed at
+_ENV_CACHE = {}
+
+# Path to .env file in the project root
+ENV_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), '.env')
+
 def get_env_path():
     """Get path to .env file in the project root."""
-    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-    return os.path.join(base_dir, '.env')
+    return ENV_PATH
 
 
 def parse_env_file(filepath):
-    """Parse .env file and return list of (key, value) tuples."""
-    if not os.path.exists(filepath):
+    """Parse .env file and return list of (key, value) tuples.
+
+    Results are cached until the file's modification time or size changes.
+    """
+    try:
+        stat = os.stat(filepath)
+    except FileNotFoundError:
+        _ENV_CACHE.pop(filepath, None)
         return []
-    
+
+    file_version = (stat.st_mtime_ns, stat.st_size)
+    cached = _ENV_CACHE.get(filepath)
+    if cached and cached[0] == file_version:
+        return list(cached[1])
+
     try:
-        env_dict = dotenv_values(filepath)
-        return list(env_dict.items())
+        # Read the whole file in one call and hand dotenv an in-memory stream
+        with open(filepath, 'rb') as f:
+            content = f.read().decode('utf-8')
+        env_dict = dotenv_values(stream=io.StringIO(content))
+        entries = list(env_dict.items())
     except Exception as e:
         logger.error(f"Error parsing .env file: {e}")
         return []
 
+    _ENV_CACHE[filepath] = (file_version, entries)
+    return list(entries)
+
 
 def write_env_file(filepath, entries):
-    """Write entries to .env file."""
+    """Write entries to .env file. The file is left untouched if its contents would not change."""
+    lines = ["# InkyPi API Keys and Secrets\n", "# Managed via web interface\n\n"]
+    for key, value in entries:
+        # Quote values with spaces or special characters
+        if ' ' in value or '"' in value or "'" in value:
+            value = f'"{value}"'
+        lines.append(f"{key}={value}\n")
+    content = "".join(lines).encode('utf-8')
+
     try:
-        with open(filepath, 'w') as f:
-            f.write("# InkyPi API Keys and Secrets\n")
-            f.write("# Managed via web interface\n\n")
-            for key, value in entries:
-                # Quote values with spaces or special characters
-                if ' ' in value or '"' in value or "'" in value:
-                    value = f'"{value}"'
-                f.write(f"{key}={value}\n")
+        try:
+            with open(filepath, 'rb') as f:
+                if f.read() == content:
+                    return True
+        except FileNotFoundError:
+            pass
+
+        _ENV_CACHE.pop(filepath, None)
+        # Write to a temporary file and swap it in so the .env file is never left half written
+        tmp_path = f"{filepath}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        if os.path.exists(filepath):
+            shutil.copymode(filepath, tmp_path)
+        os.replace(tmp_path, filepath)
         return True
     except Exception as e:
         logger.error(f"Error writing .env file: {e}")
@@ -48,13 +92,25 @@ def mask_value(value):
     """Mask API key value for display. Never reveal actual values for security."""
     if not value:
         return "(empty)"
-    return "●" * min(len(value), 20)
+    return MASKED_VALUE
 
 
 @apikeys_bp.route('/api-keys')
 def apikeys_page():
     """Render API keys management page."""
     env_path = get_env_path()
+
+    # The page only depends on the .env file, so skip rendering if the client's copy is current
+    try:
+        stat = os.stat(env_path)
+        etag = f"{_STARTUP_ID}-{stat.st_mtime_ns:x}-{stat.st_size:x}"
+    except FileNotFoundError:
+        etag = f"{_STARTUP_ID}-none"
+    if request.if_none_match.contains_weak(etag):
+        response = make_response("", 304)
+        response.set_etag(etag, weak=True)
+        return response
+
     entries = parse_env_file(env_path)
     
     # Prepare entries for template: only key and masked value (no real values for security)
@@ -63,18 +119,24 @@ def apikeys_page():
         for key, value in entries
     ]
     
-    return render_template(
+    response = make_response(render_template(
         'apikeys.html',
         entries=template_entries,
         env_exists=os.path.exists(env_path)
-    )
+    ))
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
 
 
 @apikeys_bp.route('/api-keys/save', methods=['POST'])
 def save_apikeys():
     """Save API keys to .env file."""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True)
+        # Reject bad bodies outright; treating them as an empty list would wipe the .env file
+        if not isinstance(data, dict):
+            return jsonify({"error": "Invalid request body"}), 400
         entries = data.get('entries', [])
         
         # Load existing values for keys marked as keepExisting
@@ -90,8 +152,8 @@ def save_apikeys():
             if not key:
                 continue
             
-            # Validate key format
-            if not re.match(r'^[A-Za-z_][A-Za-z0-9_]*$', key):
+            # Validate key format: an ASCII identifier is exactly [A-Za-z_][A-Za-z0-9_]*
+            if not (key.isascii() and key.isidentifier()):
                 return jsonify({"error": f"Invalid key format: {key}"}), 400
             
             if keep_existing:
@@ -1,43 +1,32 @@
-from flask import Blueprint, request, jsonify, current_app, render_template, send_file
+from flask import Blueprint, request, jsonify, render_template, send_from_directory
+from werkzeug.exceptions import NotFound
 import os
-from datetime import datetime
 
 main_bp = Blueprint("main", __name__)
 
+# App dependencies, looked up once when the blueprint is registered instead of on every request
+device_config = None
+
+@main_bp.record_once
+def bind_dependencies(state):
+    global device_config
+    device_config = state.app.config['DEVICE_CONFIG']
+
+IMAGES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'static', 'images')
+
 @main_bp.route('/')
 def main_page():
-    device_config = current_app.config['DEVICE_CONFIG']
     return render_template('inky.html', config=device_config.get_config(), plugins=device_config.get_plugins())
 
 @main_bp.route('/api/current_image')
 def get_current_image():
-    """Serve current_image.png with conditional request support (If-Modified-Since)."""
-    image_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'static', 'images', 'current_image.png')
-    
-    if not os.path.exists(image_path):
+    """Serve current_image.png with conditional request support (If-Modified-Since / If-None-Match)."""
+    # Werkzeug handles Last-Modified, ETag and 304 responses for conditional requests
+    try:
+        response = send_from_directory(IMAGES_DIR, 'current_image.png', mimetype='image/png',
+                                       conditional=True, etag=True, max_age=0)
+    except NotFound:
         return jsonify({"error": "Image not found"}), 404
-    
-    # Get the file's last modified time (truncate to seconds to match HTTP header precision)
-    file_mtime = int(os.path.getmtime(image_path))
-    last_modified = datetime.fromtimestamp(file_mtime)
-    
-    # Check If-Modified-Since header
-    if_modified_since = request.headers.get('If-Modified-Since')
-    if if_modified_since:
-        try:
-            # Parse the If-Modified-Since header
-            client_mtime = datetime.strptime(if_modified_since, '%a, %d %b %Y %H:%M:%S %Z')
-            client_mtime_seconds = int(client_mtime.timestamp())
-            
-            # Compare (both now in seconds, no sub-second precision)
-            if file_mtime <= client_mtime_seconds:
-                return '', 304
-        except (ValueError, AttributeError):
-            pass
-    
-    # Send the file with Last-Modified header
-    response = send_file(image_path, mimetype='image/png')
-    response.headers['Last-Modified'] = last_modified.strftime('%a, %d %b %Y %H:%M:%S GMT')
     response.headers['Cache-Control'] = 'no-cache'
     return response
 
@@ -45,8 +34,6 @@ def get_current_image():
 @main_bp.route('/api/plugin_order', methods=['POST'])
 def save_plugin_order():
     """Save the custom plugin order."""
-    device_config = current_app.config['DEVICE_CONFIG']
-
     data = request.get_json() or {}
     order = data.get('order', [])
 
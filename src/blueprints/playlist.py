@@ -1,25 +1,34 @@
-from flask import Blueprint, request, jsonify, current_app, render_template
+from flask import Blueprint, request, jsonify, render_template, make_response
 from utils.time_utils import calculate_seconds
-import json
+from flask import json
+import re
 from datetime import datetime, timedelta
-import os
 import logging
-from utils.app_utils import resolve_path, handle_request_files, parse_form
+from utils.app_utils import handle_request_files, parse_form
 
 
 logger = logging.getLogger(__name__)
 playlist_bp = Blueprint("playlist", __name__)
 
+# App dependencies, looked up once when the blueprint is registered instead of on every request
+device_config = None
+
+@playlist_bp.record_once
+def bind_dependencies(state):
+    global device_config
+    device_config = state.app.config['DEVICE_CONFIG']
+
+# Letters, digits and whitespace only (same character classes as str.isalnum / str.isspace)
+INSTANCE_NAME_PATTERN = re.compile(r'(?:[^\W_]|\s)+')
+
 @playlist_bp.route('/add_plugin', methods=['POST'])
 def add_plugin():
-    device_config = current_app.config['DEVICE_CONFIG']
-    refresh_task = current_app.config['REFRESH_TASK']
     playlist_manager = device_config.get_playlist_manager()
 
     try:
-        plugin_settings = parse_form(request.form)
-        refresh_settings = json.loads(plugin_settings.pop("refresh_settings"))
-        plugin_id = plugin_settings.pop("plugin_id")
+        refresh_settings = json.loads(request.form["refresh_settings"])
+        plugin_id = request.form["plugin_id"]
+        plugin_settings = parse_form(request.form, exclude=("plugin_id", "refresh_settings"))
 
         playlist = refresh_settings.get('playlist')
         instance_name = refresh_settings.get('instance_name')
@@ -27,7 +36,7 @@ def add_plugin():
             return jsonify({"error": "Playlist name is required"}), 400
         if not instance_name or not instance_name.strip():
             return jsonify({"error": "Instance name is required"}), 400
-        if not all(char.isalpha() or char.isspace() or char.isnumeric() for char in instance_name):
+        if not INSTANCE_NAME_PATTERN.fullmatch(instance_name):
             return jsonify({"error": "Instance name can only contain alphanumeric characters and spaces"}), 400
         refresh_type = refresh_settings.get('refreshType')
         if not refresh_type or refresh_type not in ["interval", "scheduled"]:
@@ -69,24 +78,27 @@ def add_plugin():
 
 @playlist_bp.route('/playlist')
 def playlists():
-    device_config = current_app.config['DEVICE_CONFIG']
     playlist_manager = device_config.get_playlist_manager()
     refresh_info = device_config.get_refresh_info()
     plugins_list = device_config.get_plugins()
 
-    return render_template(
+    response = make_response(render_template(
         'playlist.html',
         playlist_config=playlist_manager.to_dict(),
         refresh_info=refresh_info.to_dict(),
         plugins={p["id"]: p for p in plugins_list}
-    )
+    ))
+    # The page shows relative refresh times ("5 minutes ago"), so it's rendered on every request,
+    # but the ETag lets the browser skip downloading it again when nothing has changed
+    response.add_etag()
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
 
 @playlist_bp.route('/create_playlist', methods=['POST'])
 def create_playlist():
-    device_config = current_app.config['DEVICE_CONFIG']
     playlist_manager = device_config.get_playlist_manager()
 
-    data = request.json
+    data = request.get_json(silent=True) or {}
     playlist_name = data.get("playlist_name")
     start_time = data.get("start_time")
     end_time = data.get("end_time")
@@ -117,10 +129,9 @@ def create_playlist():
 
 @playlist_bp.route('/update_playlist/<string:playlist_name>', methods=['PUT'])
 def update_playlist(playlist_name):
-    device_config = current_app.config['DEVICE_CONFIG']
     playlist_manager = device_config.get_playlist_manager()
 
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
 
     new_name = data.get("new_name")
     start_time = data.get("start_time")
@@ -141,7 +152,6 @@ def update_playlist(playlist_name):
 
 @playlist_bp.route('/delete_playlist/<string:playlist_name>', methods=['DELETE'])
 def delete_playlist(playlist_name):
-    device_config = current_app.config['DEVICE_CONFIG']
     playlist_manager = device_config.get_playlist_manager()
 
     if not playlist_name:
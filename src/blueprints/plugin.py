@@ -1,14 +1,27 @@
-from flask import Blueprint, request, jsonify, current_app, render_template, send_from_directory
+from flask import Blueprint, request, jsonify, render_template, send_from_directory
 from plugins.plugin_registry import get_plugin_instance
 from utils.app_utils import resolve_path, handle_request_files, parse_form
+from utils.time_utils import calculate_seconds
 from refresh_task import ManualRefresh, PlaylistRefresh
-import json
+from flask import json
 import os
 import logging
 
 logger = logging.getLogger(__name__)
 plugin_bp = Blueprint("plugin", __name__)
 
+# App dependencies, looked up once when the blueprint is registered instead of on every request
+device_config = None
+refresh_task = None
+display_manager = None
+
+@plugin_bp.record_once
+def bind_dependencies(state):
+    global device_config, refresh_task, display_manager
+    device_config = state.app.config['DEVICE_CONFIG']
+    refresh_task = state.app.config['REFRESH_TASK']
+    display_manager = state.app.config['DISPLAY_MANAGER']
+
 def _delete_plugin_instance_images(device_config, plugin_instance_obj):
     """Delete all images associated with a plugin instance."""
     # Delete the plugin instance's generated image
@@ -31,9 +44,11 @@ def _delete_plugin_instance_images(device_config, plugin_instance_obj):
 
 # Removed module-level PLUGINS_DIR - will resolve dynamically in route handlers
 
+# Seconds browsers may cache plugin assets (icons, scripts, styles) before revalidating
+PLUGIN_ASSET_MAX_AGE = 86400
+
 @plugin_bp.route('/plugin/<plugin_id>')
 def plugin_page(plugin_id):
-    device_config = current_app.config['DEVICE_CONFIG']
     playlist_manager = device_config.get_playlist_manager()
 
     # Find the plugin by id
@@ -88,13 +103,13 @@ def image(plugin_id, filename):
         logger.error(f"File not found: {safe_path}")
         return "File not found", 404
 
-    # Serve the file from the plugin directory
-    return send_from_directory(abs_plugin_dir, filename)
+    # Serve the file from the plugin directory. Plugin assets only change when InkyPi is updated,
+    # so let browsers cache them and revalidate with a conditional request once they expire
+    return send_from_directory(abs_plugin_dir, filename, conditional=True, max_age=PLUGIN_ASSET_MAX_AGE)
 
 @plugin_bp.route('/plugin_instance_image/<path:playlist_name>/<path:plugin_id>/<path:instance_name>')
 def plugin_instance_image(playlist_name, plugin_id, instance_name):
     """Serve the generated image for a plugin instance."""
-    device_config = current_app.config['DEVICE_CONFIG']
     playlist_manager = device_config.get_playlist_manager()
 
     # Find the plugin instance
@@ -120,10 +135,9 @@ def plugin_instance_image(playlist_name, plugin_id, instance_name):
 
 @plugin_bp.route('/delete_plugin_instance', methods=['POST'])
 def delete_plugin_instance():
-    device_config = current_app.config['DEVICE_CONFIG']
     playlist_manager = device_config.get_playlist_manager()
 
-    data = request.json
+    data = request.get_json(silent=True) or {}
     playlist_name = data.get("playlist_name")
     plugin_id = data.get("plugin_id")
     plugin_instance = data.get("plugin_instance")
@@ -156,24 +170,20 @@ def delete_plugin_instance():
 
 @plugin_bp.route('/update_plugin_instance/<string:instance_name>', methods=['PUT'])
 def update_plugin_instance(instance_name):
-    device_config = current_app.config['DEVICE_CONFIG']
     playlist_manager = device_config.get_playlist_manager()
 
     try:
-        form_data = parse_form(request.form)
-
         if not instance_name:
             raise RuntimeError("Instance name is required")
 
-        plugin_id = form_data.pop("plugin_id")
+        plugin_id = request.form["plugin_id"]
         plugin_instance = playlist_manager.find_plugin(plugin_id, instance_name)
         if not plugin_instance:
             return jsonify({"error": f"Plugin instance: {instance_name} does not exist"}), 500
 
         # Handle refresh settings if provided
-        refresh_settings_json = form_data.pop("refresh_settings", None)
+        refresh_settings_json = request.form.get("refresh_settings")
         if refresh_settings_json:
-            from utils.time_utils import calculate_seconds
             refresh_settings = json.loads(refresh_settings_json)
             refresh_type = refresh_settings.get('refreshType')
 
@@ -189,7 +199,7 @@ def update_plugin_instance(instance_name):
                     plugin_instance.refresh = {"scheduled": refresh_time}
 
         # Only update plugin settings if there's actual data (not just refresh settings)
-        plugin_settings = form_data
+        plugin_settings = parse_form(request.form, exclude=("plugin_id", "refresh_settings"))
         plugin_settings.update(handle_request_files(request.files, request.form))
 
         if plugin_settings:  # Only update if there are actual plugin settings
@@ -202,11 +212,9 @@ def update_plugin_instance(instance_name):
 
 @plugin_bp.route('/display_plugin_instance', methods=['POST'])
 def display_plugin_instance():
-    device_config = current_app.config['DEVICE_CONFIG']
-    refresh_task = current_app.config['REFRESH_TASK']
     playlist_manager = device_config.get_playlist_manager()
 
-    data = request.json
+    data = request.get_json(silent=True) or {}
     playlist_name = data.get("playlist_name")
     plugin_id = data.get("plugin_id")
     plugin_instance_name = data.get("plugin_instance")
@@ -228,14 +236,11 @@ def display_plugin_instance():
 
 @plugin_bp.route('/update_now', methods=['POST'])
 def update_now():
-    device_config = current_app.config['DEVICE_CONFIG']
-    refresh_task = current_app.config['REFRESH_TASK']
-    display_manager = current_app.config['DISPLAY_MANAGER']
 
     try:
-        plugin_settings = parse_form(request.form)
+        plugin_id = request.form["plugin_id"]
+        plugin_settings = parse_form(request.form, exclude=("plugin_id",))
         plugin_settings.update(handle_request_files(request.files))
-        plugin_id = plugin_settings.pop("plugin_id")
 
         # Check if refresh task is running
         if refresh_task.running:
@@ -1,10 +1,10 @@
-from flask import Blueprint, request, jsonify, current_app, render_template, Response
+from flask import Blueprint, request, jsonify, render_template, Response
 from utils.time_utils import calculate_seconds
 from datetime import datetime, timedelta
-import os
+import subprocess
+import time
 import pytz
 import logging
-import io
 
 # Try to import cysystemd for journal reading (Linux only)
 try:
@@ -25,18 +25,28 @@ except ImportError:
 logger = logging.getLogger(__name__)
 settings_bp = Blueprint("settings", __name__)
 
+# App dependencies, looked up once when the blueprint is registered instead of on every request
+device_config = None
+refresh_task = None
+
+@settings_bp.record_once
+def bind_dependencies(state):
+    global device_config, refresh_task
+    device_config = state.app.config['DEVICE_CONFIG']
+    refresh_task = state.app.config['REFRESH_TASK']
+
+# Timezone choices for the settings page, sorted once since they never change while running
+TIMEZONES = sorted(pytz.all_timezones_set)
+
 @settings_bp.route('/settings')
 def settings_page():
-    device_config = current_app.config['DEVICE_CONFIG']
-    timezones = sorted(pytz.all_timezones_set)
-    return render_template('settings.html', device_settings=device_config.get_config(), timezones = timezones)
+    return render_template('settings.html', device_settings=device_config.get_config(), timezones = TIMEZONES)
 
 @settings_bp.route('/save_settings', methods=['POST'])
 def save_settings():
-    device_config = current_app.config['DEVICE_CONFIG']
-
     try:
-        form_data = request.form.to_dict()
+        # Read fields straight from the form MultiDict instead of copying it into a dict
+        form_data = request.form
 
         unit, interval, time_format = form_data.get('unit'), form_data.get("interval"), form_data.get("timeFormat")
         if not unit or unit not in ["minute", "hour"]:
@@ -73,7 +83,6 @@ def save_settings():
 
         if plugin_cycle_interval_seconds != previous_interval_seconds:
             # wake the background thread up to signal interval config change
-            refresh_task = current_app.config['REFRESH_TASK']
             refresh_task.signal_config_change()
     except RuntimeError as e:
         return jsonify({"error": str(e)}), 500
@@ -86,58 +95,54 @@ def shutdown():
     data = request.get_json() or {}
     if data.get("reboot"):
         logger.info("Reboot requested")
-        os.system("sudo reboot")
+        command = ["sudo", "reboot"]
     else:
         logger.info("Shutdown requested")
-        os.system("sudo shutdown -h now")
+        command = ["sudo", "shutdown", "-h", "now"]
+    # Make sure pending config changes hit the disk before the system goes down
+    device_config.flush_config()
+    # Don't block the request (or spawn a shell) so the response is sent before the system goes down
+    try:
+        subprocess.Popen(command, start_new_session=True, close_fds=True,
+                         stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError as e:
+        logger.error(f"Failed to run {' '.join(command)}: {e}")
+        return jsonify({"error": f"An error occurred: {str(e)}"}), 500
     return jsonify({"success": True})
 
 @settings_bp.route('/download-logs')
 def download_logs():
     try:
-        buffer = io.StringIO()
-        
         # Get 'hours' from query parameters, default to 2 if not provided or invalid
         hours_str = request.args.get('hours', '2')
         try:
             hours = int(hours_str)
         except ValueError:
             hours = 2
-        since = datetime.now() - timedelta(hours=hours)
+        now = datetime.now()
+        since = now - timedelta(hours=hours)
 
         if not JOURNAL_AVAILABLE:
             # Return a message when running in development mode without systemd
-            buffer.write(f"Log download not available in development mode (cysystemd not installed).\n")
-            buffer.write(f"Logs would normally show InkyPi service logs from the last {hours} hours.\n")
-            buffer.write(f"\nTo see Flask development logs, check your terminal output.\n")
+            lines = [
+                "Log download not available in development mode (cysystemd not installed).\n",
+                f"Logs would normally show InkyPi service logs from the last {hours} hours.\n",
+                "\nTo see Flask development logs, check your terminal output.\n",
+            ]
         else:
             reader = JournalReader()
             reader.open(JournalOpenMode.SYSTEM)
+            # Rules are journal matches, so only this unit's entries are read
             reader.add_filter(Rule("_SYSTEMD_UNIT", "inkypi.service"))
             reader.seek_realtime_usec(int(since.timestamp() * 1_000_000))
+            lines = _format_journal_records(reader, int(now.timestamp() * 1_000_000))
 
-            for record in reader:
-                try:
-                    ts = datetime.fromtimestamp(record.get_realtime_usec() / 1_000_000)
-                    formatted_ts = ts.strftime("%b %d %H:%M:%S")
-                except Exception:
-                    formatted_ts = "??? ?? ??:??:??"
-
-                data = record.data
-                hostname = data.get("_HOSTNAME", "unknown-host")
-                identifier = data.get("SYSLOG_IDENTIFIER") or data.get("_COMM", "?")
-                pid = data.get("_PID", "?")
-                msg = data.get("MESSAGE", "").rstrip()
-
-                # Format the log entry similar to the journalctl default output
-                buffer.write(f"{formatted_ts} {hostname} {identifier}[{pid}]: {msg}\n")
-
-        buffer.seek(0)
         # Add date and time to the filename
-        now_str = datetime.now().strftime("%Y%m%d-%H%M%S")
+        now_str = now.strftime("%Y%m%d-%H%M%S")
         filename = f"inkypi_{now_str}.log"
+        # Stream the lines as they're read instead of building the whole log in memory first
         return Response(
-            buffer.read(),
+            lines,
             mimetype="text/plain",
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
@@ -146,3 +151,33 @@ def download_logs():
         logger.error(f"Error reading logs: {e}")
         return Response(f"Error reading logs: {e}", status=500, mimetype="text/plain")
 
+def _format_journal_records(reader, until_usec):
+    """Yields journal records up to until_usec, formatted like the journalctl default output."""
+    # Records often share a second, so the timestamp is only formatted when the second changes
+    last_second = None
+    formatted_ts = None
+    try:
+        for record in reader:
+            realtime_usec = record.get_realtime_usec()
+            # Stop at the time of the request, rather than following entries logged while streaming
+            if realtime_usec > until_usec:
+                break
+            second = realtime_usec // 1_000_000
+            if second != last_second:
+                try:
+                    formatted_ts = time.strftime("%b %d %H:%M:%S", time.localtime(second))
+                except Exception:
+                    formatted_ts = "??? ?? ??:??:??"
+                last_second = second
+
+            data = record.data
+            hostname = data.get("_HOSTNAME", "unknown-host")
+            identifier = data.get("SYSLOG_IDENTIFIER") or data.get("_COMM", "?")
+            pid = data.get("_PID", "?")
+            msg = data.get("MESSAGE", "").rstrip()
+
+            yield f"{formatted_ts} {hostname} {identifier}[{pid}]: {msg}\n"
+    except Exception as e:
+        # The response has already started, so report the failure at the end of the log
+        logger.error(f"Error reading logs: {e}")
+        yield f"Error reading logs: {e}\n"
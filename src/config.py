@@ -1,6 +1,7 @@
 import os
 import json
 import logging
+import threading
 from dotenv import load_dotenv
 from model import PlaylistManager, RefreshInfo
 
@@ -19,9 +20,21 @@ class Config:
     # Directory path for storing plugin instance images
     plugin_image_dir = os.path.join(BASE_DIR, "static", "images", "plugins")
 
+    # Delay before writing the config file, so back-to-back changes result in a single write
+    WRITE_DELAY_SECONDS = 0.5
+
     def __init__(self):
         self.config = self.read_config()
+        self._resolution = None
+        self._write_lock = threading.Lock()
+        self._write_timer = None
+        self._pending_config = None
+        self._written_config = None
         self.plugins_list = self.read_plugins_list()
+        # plugins are only discovered at startup, so index them by id once for get_plugin lookups
+        self._plugins_by_id = {}
+        for plugin in self.plugins_list:
+            self._plugins_by_id.setdefault(plugin['id'], plugin)
         self.playlist_manager = self.load_playlist_manager()
         self.refresh_info = self.load_refresh_info()
 
@@ -37,28 +50,63 @@ class Config:
 
     def read_plugins_list(self):
         """Reads the plugin-info.json config JSON from each plugin folder. Excludes the base plugin."""
-        # Iterate over all plugin folders
+        # Iterate over all plugin folders; scandir entries carry their file type, saving a stat per entry
+        with os.scandir(os.path.join(self.BASE_DIR, "plugins")) as entries:
+            plugin_dirs = sorted(
+                (entry for entry in entries if entry.is_dir() and entry.name != "__pycache__"),
+                key=lambda entry: entry.name)
+
         plugins_list = []
-        for plugin in sorted(os.listdir(os.path.join(self.BASE_DIR, "plugins"))):
-            plugin_path = os.path.join(self.BASE_DIR, "plugins", plugin)
-            if os.path.isdir(plugin_path) and plugin != "__pycache__":
-                # Check if the plugin-info.json file exists
-                plugin_info_file = os.path.join(plugin_path, "plugin-info.json")
-                if os.path.isfile(plugin_info_file):
-                    logger.debug(f"Reading plugin info from {plugin_info_file}")
-                    with open(plugin_info_file) as f:
-                        plugin_info = json.load(f)
-                    plugins_list.append(plugin_info)
+        for plugin_dir in plugin_dirs:
+            plugin_info_file = os.path.join(plugin_dir.path, "plugin-info.json")
+            # Open the plugin-info.json file directly rather than checking it exists first
+            try:
+                with open(plugin_info_file, 'rb') as f:
+                    plugin_info = json.loads(f.read())
+            except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+                continue
+            logger.debug(f"Read plugin info from {plugin_info_file}")
+            plugins_list.append(plugin_info)
 
         return plugins_list
 
     def write_config(self):
-        """Updates the cached config from the model objects and writes to the config file."""
-        logger.debug(f"Writing device config to {self.config_file}")
+        """Updates the cached config from the model objects and schedules a write to the config file.
+
+        The file is written after WRITE_DELAY_SECONDS, so several changes in quick succession are
+        coalesced into one write. Call flush_config() to write any pending changes immediately.
+        """
+        # plugin instances and playlists are also modified directly, so always rebuild the playlist dict here
+        self.playlist_manager.invalidate_cache()
         self.update_value("playlist_config", self.playlist_manager.to_dict())
         self.update_value("refresh_info", self.refresh_info.to_dict())
-        with open(self.config_file, 'w') as outfile:
-            json.dump(self.config, outfile, indent=4)
+        content = json.dumps(self.config, indent=4)
+        with self._write_lock:
+            # nothing to do if this is what's already queued, or already on disk with nothing queued
+            if content == (self._pending_config if self._pending_config is not None else self._written_config):
+                return
+            self._pending_config = content
+            if self._write_timer is None:
+                self._write_timer = threading.Timer(self.WRITE_DELAY_SECONDS, self.flush_config)
+                self._write_timer.daemon = True
+                self._write_timer.start()
+
+    def flush_config(self):
+        """Writes any pending config changes to the config file, replacing it atomically."""
+        with self._write_lock:
+            if self._write_timer is not None:
+                self._write_timer.cancel()
+                self._write_timer = None
+            content, self._pending_config = self._pending_config, None
+            if content is None:
+                return
+
+            logger.debug(f"Writing device config to {self.config_file}")
+            tmp_file = f"{self.config_file}.tmp"
+            with open(tmp_file, 'w') as outfile:
+                outfile.write(content)
+            os.replace(tmp_file, self.config_file)
+            self._written_config = content
 
     def get_config(self, key=None, default={}):
         """Gets the value of a specific configuration key or returns the entire config if none provided."""
@@ -77,10 +125,7 @@ class Config:
         plugins_dict = {p['id']: p for p in self.plugins_list}
 
         # Build ordered list
-        ordered = []
-        for plugin_id in plugin_order:
-            if plugin_id in plugins_dict:
-                ordered.append(plugins_dict.pop(plugin_id))
+        ordered = [plugins_dict.pop(plugin_id) for plugin_id in plugin_order if plugin_id in plugins_dict]
 
         # Append any remaining plugins not in the order (new plugins)
         ordered.extend(plugins_dict.values())
@@ -93,21 +138,26 @@ class Config:
 
     def get_plugin(self, plugin_id):
         """Finds and returns a plugin config by its ID."""
-        return next((plugin for plugin in self.plugins_list if plugin['id'] == plugin_id), None)
+        return self._plugins_by_id.get(plugin_id)
 
     def get_resolution(self):
         """Returns the display resolution as a tuple (width, height) from the configuration."""
-        resolution = self.get_config("resolution")
-        width, height = resolution
-        return (int(width), int(height))
+        if self._resolution is None:
+            width, height = self.get_config("resolution")
+            self._resolution = (int(width), int(height))
+        return self._resolution
 
     def update_config(self, config):
         """Updates the config with the new values provided and writes to the config file."""
+        if "resolution" in config:
+            self._resolution = None
         self.config.update(config)
         self.write_config()
 
     def update_value(self, key, value, write=False):
         """Updates a specific key in the configuration with a new value and optionally writes it to the config file."""
+        if key == "resolution":
+            self._resolution = None
         self.config[key] = value
         if write:
             self.write_config()
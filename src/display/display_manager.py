@@ -2,7 +2,7 @@ import fnmatch
 import json
 import logging
 
-from utils.image_utils import resize_image, change_orientation, apply_image_enhancement
+from utils.image_utils import resize_image, change_orientation, apply_image_enhancement, save_image_atomic
 from display.mock_display import MockDisplay
 
 logger = logging.getLogger(__name__)
@@ -72,7 +72,7 @@ class DisplayManager:
         
         # Save the image
         logger.info(f"Saving image to {self.device_config.current_image_file}")
-        image.save(self.device_config.current_image_file)
+        save_image_atomic(image, self.device_config.current_image_file)
 
         # Resize and adjust orientation
         image = change_orientation(image, self.device_config.get_config("orientation"))
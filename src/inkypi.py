@@ -15,11 +15,13 @@ import os
 import random
 import time
 import sys
+import signal
 import json
 import logging
 import threading
 import argparse
 from utils.app_utils import generate_startup_image
+from utils.json_provider import configure_json_provider
 from flask import Flask, request, send_from_directory
 from werkzeug.serving import is_running_from_reloader
 from config import Config
@@ -59,6 +61,10 @@ template_dirs = [
    os.path.join(os.path.dirname(__file__), "plugins"),      # Plugin templates
 ]
 app.jinja_loader = ChoiceLoader([FileSystemLoader(directory) for directory in template_dirs])
+configure_json_provider(app)
+# JSON responses are only read by the web UI, so skip key sorting and pretty printing
+app.json.sort_keys = False
+app.json.compact = True
 
 device_config = Config()
 display_manager = DisplayManager(device_config)
@@ -73,6 +79,8 @@ app.config['REFRESH_TASK'] = refresh_task
 
 # Set additional parameters
 app.config['MAX_FORM_PARTS'] = 10_000
+# Compiled templates are cached; only re-check them on disk for changes while developing
+app.config['TEMPLATES_AUTO_RELOAD'] = DEV_MODE
 
 # Register Blueprints
 app.register_blueprint(main_bp)
@@ -86,6 +94,9 @@ register_heif_opener()
 
 if __name__ == '__main__':
 
+    # exit through the finally block below on SIGTERM (systemd stop) so pending config writes are flushed
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
     # start the background refresh task
     refresh_task.start()
 
@@ -115,3 +126,4 @@ if __name__ == '__main__':
         serve(app, host="0.0.0.0", port=PORT, threads=1)
     finally:
         refresh_task.stop()
+        device_config.flush_config()
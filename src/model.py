@@ -69,8 +69,31 @@ class PlaylistManager:
 
     def __init__(self, playlists=[], active_playlist=None):
         """Initialize PlaylistManager with a list of playlists."""
+        self._dict_cache = None
         self.playlists = playlists
         self.active_playlist = active_playlist
+        self._reindex_playlists()
+
+    @property
+    def active_playlist(self):
+        return self._active_playlist
+
+    @active_playlist.setter
+    def active_playlist(self, name):
+        if getattr(self, "_active_playlist", None) != name:
+            self.invalidate_cache()
+        self._active_playlist = name
+
+    def _reindex_playlists(self):
+        """Rebuild the name lookup used by get_playlist, keeping the first match for duplicates."""
+        self._playlists_by_name = {}
+        for playlist in self.playlists:
+            self._playlists_by_name.setdefault(playlist.name, playlist)
+
+    def invalidate_cache(self):
+        """Drops the cached to_dict() result. Called on every change made through the manager, and by
+        the device config before writing, since plugin instances are also modified directly."""
+        self._dict_cache = None
 
     def get_playlist_names(self):
         """Returns a list of all playlist names."""
@@ -78,8 +101,10 @@ class PlaylistManager:
 
     def add_default_playlist(self):
         """Add a default playlist to the manager, called when no playlists exist."""
-        return self.playlists.append(
-            Playlist("Default", PlaylistManager.DEFAULT_PLAYLIST_START, PlaylistManager.DEFAULT_PLAYLIST_END, []))
+        self.invalidate_cache()
+        playlist = Playlist("Default", PlaylistManager.DEFAULT_PLAYLIST_START, PlaylistManager.DEFAULT_PLAYLIST_END, [])
+        self.playlists.append(playlist)
+        self._playlists_by_name.setdefault(playlist.name, playlist)
 
     def find_plugin(self, plugin_id, instance):
         """Searches playlists to find a plugin with the given ID and instance."""
@@ -106,7 +131,7 @@ class PlaylistManager:
 
     def get_playlist(self, playlist_name):
         """Returns the playlist with the specified name."""
-        return next((p for p in self.playlists if p.name == playlist_name), None)
+        return self._playlists_by_name.get(playlist_name)
 
     def add_plugin_to_playlist(self, playlist_name, plugin_data):
         """Adds a plugin to a playlist by the specified name. Returns true if successfully added,
@@ -114,6 +139,7 @@ class PlaylistManager:
         playlist = self.get_playlist(playlist_name)
         if playlist:
             if playlist.add_plugin(plugin_data):
+                self.invalidate_cache()
                 return True
         else:
             logger.warning(f"Playlist '{playlist_name}' not found.")
@@ -125,7 +151,10 @@ class PlaylistManager:
             start_time = PlaylistManager.DEFAULT_PLAYLIST_START
         if not end_time:
             end_time = PlaylistManager.DEFAULT_PLAYLIST_END
-        self.playlists.append(Playlist(name, start_time, end_time))
+        playlist = Playlist(name, start_time, end_time)
+        self.playlists.append(playlist)
+        self._playlists_by_name.setdefault(name, playlist)
+        self.invalidate_cache()
         return True
 
     def update_playlist(self, old_name, new_name, start_time, end_time):
@@ -135,6 +164,8 @@ class PlaylistManager:
             playlist.name = new_name
             playlist.start_time = start_time
             playlist.end_time = end_time
+            self._reindex_playlists()
+            self.invalidate_cache()
             return True
         logger.warning(f"Playlist '{old_name}' not found.")
         return False
@@ -142,12 +173,17 @@ class PlaylistManager:
     def delete_playlist(self, name):
         """Deletes the playlist with the specified name."""
         self.playlists = [p for p in self.playlists if p.name != name]
+        self._playlists_by_name.pop(name, None)
+        self.invalidate_cache()
 
     def to_dict(self):
-        return {
-            "playlists": [p.to_dict() for p in self.playlists],
-            "active_playlist": self.active_playlist
-        }
+        """Returns the manager as a dict, reusing the previous result until the manager changes."""
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "playlists": [p.to_dict() for p in self.playlists],
+                "active_playlist": self.active_playlist
+            }
+        return self._dict_cache
 
     @classmethod
     def from_dict(cls, data):
@@ -181,6 +217,13 @@ class Playlist:
         self.end_time = end_time
         self.plugins = [PluginInstance.from_dict(p) for p in (plugins or [])]
         self.current_plugin_index = current_plugin_index
+        self._reindex_plugins()
+
+    def _reindex_plugins(self):
+        """Rebuild the (plugin_id, name) lookup used by find_plugin, keeping the first match for duplicates."""
+        self._plugins_by_key = {}
+        for plugin in self.plugins:
+            self._plugins_by_key.setdefault((plugin.plugin_id, plugin.name), plugin)
 
     def is_active(self, current_time):
         """Check if the playlist is active at the given time."""
@@ -196,7 +239,9 @@ class Playlist:
         if self.find_plugin(plugin_data["plugin_id"], plugin_data["name"]):
             logger.warning(f"Plugin '{plugin_data['plugin_id']}' with instance '{plugin_data['name']}' already exists.")
             return False
-        self.plugins.append(PluginInstance.from_dict(plugin_data))
+        plugin = PluginInstance.from_dict(plugin_data)
+        self.plugins.append(plugin)
+        self._plugins_by_key[(plugin.plugin_id, plugin.name)] = plugin
         return True
 
     def update_plugin(self, plugin_id, instance_name, updated_data):
@@ -204,6 +249,7 @@ class Playlist:
         plugin = self.find_plugin(plugin_id, instance_name)
         if plugin:
             plugin.update(updated_data)
+            self._reindex_plugins()
             return True
         logger.warning(f"Plugin '{plugin_id}' with name '{instance_name}' not found.")
         return False
@@ -216,11 +262,12 @@ class Playlist:
         if len(self.plugins) == initial_count:
             logger.warning(f"Plugin '{plugin_id}' with instance '{name}' not found.")
             return False
+        self._plugins_by_key.pop((plugin_id, name), None)
         return True
 
     def find_plugin(self, plugin_id, name):
         """Find a plugin instance by its plugin_id and name."""
-        return next((p for p in self.plugins if p.plugin_id == plugin_id and p.name == name), None)
+        return self._plugins_by_key.get((plugin_id, name))
 
     def get_next_plugin(self):
         """Returns the next plugin instance in the playlist and update the current_plugin_index."""
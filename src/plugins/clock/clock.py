@@ -236,26 +236,33 @@ class Clock(BasePlugin):
         start_angle = -start_angle
         end_angle = -end_angle
 
-        theta = (np.arctan2(x-cx,y-cy) - start_angle)  % (2*np.pi)
+        # Work on a single (h, w) buffer in place to avoid full-size temporaries
+        theta = np.arctan2(x-cx, y-cy)
+        theta -= start_angle
+        np.mod(theta, 2*np.pi, out=theta)
 
         angle_range = ((end_angle-start_angle) % (2 * np.pi))
         if angle_range == 0:
             angle_range = 2*np.pi  # Special case: full circle gradient
 
         anglemask = theta <= angle_range
-        theta = theta / angle_range  # Normalize to [0, 1] within range
+        theta /= angle_range  # Normalize to [0, 1] within range
 
         # Interpolate colors between start and end within the mask
         gradient = np.zeros((h, w, 4), dtype=np.uint8)
         start_color = Clock.pad_color(start_color)
         end_color = Clock.pad_color(end_color)
+        inverse_theta = 1 - theta
+        channel = np.empty_like(theta)
+        end_channel = np.empty_like(theta)
         for c in range(4):  # Iterate through RGBA channels
-            gradient[..., c] = (
-                start_color[c] * (1 - theta) + end_color[c] * (theta)
-            ).astype(np.uint8)
+            np.multiply(inverse_theta, start_color[c], out=channel)
+            np.multiply(theta, end_color[c], out=end_channel)
+            channel += end_channel
+            gradient[..., c] = channel
         
-        # Fill with the specified solid color
-        gradient[~anglemask] = (0, 0, 0, 0)
+        # Clear everything outside the gradient with a scalar store on all channels
+        gradient[~anglemask] = 0
         return Image.fromarray(gradient, mode="RGBA")
 
     @staticmethod
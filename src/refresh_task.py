@@ -6,7 +6,7 @@ import psutil
 import pytz
 from datetime import datetime, timezone
 from plugins.plugin_registry import get_plugin_instance
-from utils.image_utils import compute_image_hash
+from utils.image_utils import compute_image_hash, save_image_atomic
 from model import RefreshInfo, PlaylistManager
 from PIL import Image
 
@@ -29,6 +29,10 @@ class RefreshTask:
         self.refresh_event.set()
         self.refresh_result = {}
 
+        # timezone resolved for the configured name, re-resolved only when the setting changes
+        self._tz_name = None
+        self._tz = None
+
     def start(self):
         """Starts the background thread for refreshing the display."""
         if not self.thread or not self.thread.is_alive():
@@ -158,7 +162,10 @@ class RefreshTask:
     def _get_current_datetime(self):
         """Retrieves the current datetime based on the device's configured timezone."""
         tz_str = self.device_config.get_config("timezone", default="UTC")
-        return datetime.now(pytz.timezone(tz_str))
+        if tz_str != self._tz_name:
+            self._tz = pytz.timezone(tz_str)
+            self._tz_name = tz_str
+        return datetime.now(self._tz)
 
     def _determine_next_plugin(self, playlist_manager, latest_refresh_info, current_dt):
         """Determines the next plugin to refresh based on the active playlist, plugin cycle interval, and current time."""
@@ -277,7 +284,7 @@ class PlaylistRefresh(RefreshAction):
             logger.info(f"Refreshing plugin instance. | plugin_instance: '{self.plugin_instance.name}'") 
             # Generate a new image
             image = plugin.generate_image(self.plugin_instance.settings, device_config)
-            image.save(plugin_image_path)
+            save_image_atomic(image, plugin_image_path)
             self.plugin_instance.latest_refresh_time = current_dt.isoformat()
         else:
             logger.info(f"Not time to refresh plugin instance, using latest image. | plugin_instance: {self.plugin_instance.name}.")
@@ -4,10 +4,16 @@ import socket
 import subprocess
 
 from pathlib import Path
-from PIL import Image, ImageDraw, ImageFont, ImageOps
+from PIL import Image, ImageDraw, ImageFont, ImageOps, ExifTags
 
 logger = logging.getLogger(__name__)
 
+# Chunk size used when copying uploaded files to disk
+UPLOAD_BUFFER_SIZE = 1 << 20
+
+# File types accepted by handle_request_files
+ALLOWED_FILE_EXTENSIONS = frozenset({'pdf', 'png', 'avif', 'jpg', 'jpeg', 'gif', 'webp', 'heif', 'heic'})
+
 FONT_FAMILIES = {
     "Dogica": [{
         "font-weight": "normal",
@@ -135,16 +141,17 @@ def generate_startup_image(dimensions=(800,480)):
 
     return image
 
-def parse_form(request_form):
-    request_dict = request_form.to_dict()
-    for key in request_form.keys():
-        if key.endswith('[]'):
-            request_dict[key] = request_form.getlist(key)
-    return request_dict
+def parse_form(request_form, exclude=()):
+    """Converts the form to a dict in one pass. Keys ending in '[]' keep all values as a list, keys in exclude are skipped."""
+    return {
+        key: request_form.getlist(key) if key.endswith('[]') else request_form.get(key)
+        for key in request_form.keys()
+        if key not in exclude
+    }
 
 def handle_request_files(request_files, form_data={}):
-    allowed_file_extensions = {'pdf', 'png', 'avif', 'jpg', 'jpeg', 'gif', 'webp', 'heif', 'heic'}
     file_location_map = {}
+    file_save_dir = resolve_path(os.path.join("static", "images", "saved"))
     # handle existing file locations being provided as part of the form data
     for key in set(request_files.keys()):
         is_list = key.endswith('[]')
@@ -157,27 +164,27 @@ def handle_request_files(request_files, form_data={}):
         if not file_name:
             continue
 
-        extension = os.path.splitext(file_name)[1].replace('.', '')
-        if not extension or extension.lower() not in allowed_file_extensions:
+        extension = os.path.splitext(file_name)[1][1:].lower()
+        if extension not in ALLOWED_FILE_EXTENSIONS:
             continue
 
         file_name = os.path.basename(file_name)
-
-        file_save_dir = resolve_path(os.path.join("static", "images", "saved"))
         file_path = os.path.join(file_save_dir, file_name)
 
-        # Open the image and apply EXIF transformation before saving
+        # Rotated JPEGs are decoded and saved with the EXIF transformation applied,
+        # everything else is copied to disk in chunks without being decoded
+        transposed = False
         if extension in {'jpg', 'jpeg'}:
             try:
                 with Image.open(file) as img:
-                    img = ImageOps.exif_transpose(img)
-                    img.save(file_path)
+                    if img.getexif().get(ExifTags.Base.Orientation, 1) != 1:
+                        ImageOps.exif_transpose(img).save(file_path)
+                        transposed = True
             except Exception as e:
                 logger.warning(f"EXIF processing error for {file_name}: {e}")
-                file.save(file_path)
-        else:
-            # Directly save non-JPEG files
-            file.save(file_path)
+            file.stream.seek(0)
+        if not transposed:
+            file.save(file_path, buffer_size=UPLOAD_BUFFER_SIZE)
 
         if is_list:
             file_location_map.setdefault(key, [])
@@ -82,6 +82,18 @@ def apply_image_enhancement(img, image_settings={}):
 
     return img
 
+def save_image_atomic(image, file_path, format="PNG"):
+    """Encode the image in memory and atomically replace file_path with the result.
+
+    Readers of file_path (e.g. the web UI polling the current image) never see a partially written file.
+    """
+    buffer = BytesIO()
+    image.save(buffer, format=format)
+    tmp_path = f"{file_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(buffer.getbuffer())
+    os.replace(tmp_path, file_path)
+
 def compute_image_hash(image):
     """Compute SHA-256 hash of an image."""
     image = image.convert("RGB")
@@ -106,13 +118,25 @@ def take_screenshot_html(html_str, dimensions, timeout_ms=None):
 
     return image
 
+# Browser binary found by _find_chromium_binary, kept for the lifetime of the process
+_chromium_binary = None
+
 def _find_chromium_binary():
-    """Find the first available Chromium-based binary in system PATH."""
+    """Find the first available Chromium-based binary in system PATH.
+
+    The result is cached once found; a missing browser is looked up again on the next call
+    so one installed while the app is running is still picked up.
+    """
+    global _chromium_binary
+    if _chromium_binary:
+        return _chromium_binary
+
     candidates = ["chromium-headless-shell", "chromium", "chrome"]
     for candidate in candidates:
         path = shutil.which(candidate)
         if path:
             logger.debug(f"Found browser binary: {candidate} at {path}")
+            _chromium_binary = candidate
             return candidate
     return None
 
@@ -153,11 +177,14 @@ def take_screenshot(target, dimensions, timeout_ms=None):
         ]
         if timeout_ms:
             command.append(f"--timeout={timeout_ms}")
-        result = subprocess.run(command, capture_output=True, check=False)
+        # Chromium's stdout is never used, so only stderr is piped back for error reporting
+        result = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=False)
 
         # Check if the process failed or the output file is missing
         if result.returncode != 0 or not os.path.exists(img_file_path):
             logger.error(f"Failed to take screenshot (return code: {result.returncode})")
+            if result.stderr:
+                logger.debug(f"Browser output: {result.stderr.decode('utf-8', errors='replace')}")
             return None
 
         # Load the image using PIL
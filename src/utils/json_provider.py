@@ -0,0 +1,54 @@
+"""
+orjson-backed JSON provider for Flask
+
+Flask serializes every jsonify() response and parses every request.get_json()
+body with the pure-Python json module. When orjson is installed this provider
+swaps in its C implementation. orjson has no wheels for every Pi model (e.g.
+armv6 Pi Zero), so it stays optional and Flask's default provider is used when
+it's missing.
+
+Usage:
+    from utils.json_provider import configure_json_provider
+
+    configure_json_provider(app)
+"""
+
+import logging
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider using orjson, falling back to Flask's default for anything orjson can't handle."""
+
+    def dumps(self, obj, **kwargs):
+        # Match Flask's defaults: sorted keys, and datetimes etc. formatted by DefaultJSONProvider.default
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def configure_json_provider(app):
+    """Use the orjson provider for the app if orjson is installed."""
+    if ORJSON_AVAILABLE:
+        app.json = OrjsonProvider(app)
+        logger.debug("Using orjson for JSON serialization")
+    else:
+        logger.debug("orjson not installed, using default JSON provider")
@@ -1,6 +1,6 @@
 import pytest
 
-from src.model import Playlist
+from src.model import Playlist, PlaylistManager
 
 class TestPlaylist:
 
@@ -49,4 +49,58 @@ class TestPlaylist:
         playlist = Playlist("Test Playlist", start, end)
         assert playlist.is_active(current) == expected
         assert playlist.get_priority() == priority
-        
\ No newline at end of file
+        
+    def test_find_plugin_tracks_add_and_delete(self):
+        playlist = Playlist("Test Playlist", "00:00", "24:00")
+        plugin_data = {"plugin_id": "clock", "name": "Kitchen", "plugin_settings": {}, "refresh": {"interval": 60}}
+
+        assert playlist.find_plugin("clock", "Kitchen") is None
+        assert playlist.add_plugin(plugin_data)
+        assert playlist.find_plugin("clock", "Kitchen") is playlist.plugins[0]
+        assert not playlist.add_plugin(plugin_data)
+
+        assert playlist.delete_plugin("clock", "Kitchen")
+        assert playlist.find_plugin("clock", "Kitchen") is None
+        assert playlist.plugins == []
+
+    def test_find_plugin_after_rename(self):
+        plugin_data = {"plugin_id": "clock", "name": "Kitchen", "plugin_settings": {}, "refresh": {"interval": 60}}
+        playlist = Playlist("Test Playlist", "00:00", "24:00", [plugin_data])
+
+        assert playlist.update_plugin("clock", "Kitchen", {"name": "Office"})
+        assert playlist.find_plugin("clock", "Kitchen") is None
+        assert playlist.find_plugin("clock", "Office").name == "Office"
+
+
+class TestPlaylistManager:
+
+    def test_to_dict_is_cached_until_changed(self):
+        manager = PlaylistManager([])
+        manager.add_default_playlist()
+
+        first = manager.to_dict()
+        assert manager.to_dict() is first
+
+        manager.add_playlist("Evening", "18:00", "22:00")
+        second = manager.to_dict()
+        assert second is not first
+        assert [p["name"] for p in second["playlists"]] == ["Default", "Evening"]
+
+        manager.active_playlist = "Evening"
+        assert manager.to_dict()["active_playlist"] == "Evening"
+
+        manager.delete_playlist("Evening")
+        assert [p["name"] for p in manager.to_dict()["playlists"]] == ["Default"]
+
+    def test_get_playlist_tracks_rename_and_delete(self):
+        manager = PlaylistManager([])
+        manager.add_playlist("Morning", "06:00", "12:00")
+
+        assert manager.get_playlist("Morning").start_time == "06:00"
+
+        manager.update_playlist("Morning", "Breakfast", "07:00", "10:00")
+        assert manager.get_playlist("Morning") is None
+        assert manager.get_playlist("Breakfast").start_time == "07:00"
+
+        manager.delete_playlist("Breakfast")
+        assert manager.get_playlist("Breakfast") is None